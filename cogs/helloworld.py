@@ -21,7 +21,7 @@ class HelloWorld(commands.Cog, name='Hello World'):
     async def hellolangs(self, ctx):
         """Prints all the languages that there are helloworld's for"""
         langs = ''
-        for fName in os.listdir("cogs/helloworld"):
+        for fName in sorted(os.listdir("cogs/helloworld")):
             langs += fName.replace('.txt', '') + '\n'
         await ctx.send(langs)
 
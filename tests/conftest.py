@@ -0,0 +1,20 @@
+"""
+Pytest configuration for the test suite.
+The cogs import the user's local `config.py` (see the README), which holds real tokens and is
+deliberately not tracked. The tests only need the names to exist, so when no local config is
+present a stub module with placeholder values is injected before the cogs get imported.
+"""
+import sys
+import types
+
+try:
+    import config  # noqa: F401
+except ImportError:
+    config = types.ModuleType('config')
+    config.ALBOT_TOKEN = 'albot-token'
+    config.GITHUB_TOKEN = 'github-token'
+    config.OFFICER_ROLE = 0
+    config.MEME_CHANNEL = 0
+    config.OFFICER_CHANNEL = 0
+    config.LEADERBOARD = 0
+    sys.modules['config'] = config
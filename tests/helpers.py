@@ -1,25 +1,53 @@
-# from __future__ import annotations
+from __future__ import annotations
 
 import asyncio
 import collections
+import copy
 import functools
 import inspect
-import itertools
 import logging
 import unittest.mock
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Optional, Tuple
 
 import discord
 from discord.ext.commands import Bot, Context
 
-for logger in logging.Logger.manager.loggerDict.values():
-    # Set all loggers to CRITICAL by default to prevent screen clutter during testing
+# Silence all logging below CRITICAL to prevent screen clutter during testing. Unlike walking
+# `loggerDict` and lowering each logger, this single call also covers loggers created after this
+# module is imported.
+logging.disable(logging.CRITICAL)
 
-    if not isinstance(logger, logging.Logger):
-        # There might be some logging.PlaceHolder objects in there
-        continue
 
-    logger.setLevel(logging.CRITICAL)
+@functools.lru_cache(maxsize=None)
+def _coroutine_method_names(spec_type: type) -> Tuple[str, ...]:
+    """
+    Return the names of all coroutine functions defined by `spec_type`.
+    The set of coroutine methods on a discord.py class never changes within a test run, so the
+    introspection runs once per spec type and every mock instantiation afterwards reuses the
+    cached names. Scanning `vars()` along the MRO inspects each unbound function in a single
+    attribute read, whereas `inspect.getmembers` on an instance goes through the descriptor
+    protocol for every attribute.
+    """
+    members = {}
+    for klass in spec_type.__mro__:
+        for name, attr in vars(klass).items():
+            members.setdefault(name, attr)
+
+    return tuple(name for name, attr in members.items() if inspect.iscoroutinefunction(attr))
+
+
+_discord_id = 0
+
+
+def _next_discord_id() -> int:
+    """
+    Return the next unique snowflake-style ID for a mock object.
+    A plain integer increment; `itertools.count` + `next` spends extra time in iterator protocol
+    dispatch on what is one of the hottest lines of mock construction.
+    """
+    global _discord_id
+    _discord_id += 1
+    return _discord_id - 1
 
 
 def async_test(wrapped):
@@ -43,10 +71,18 @@ class HashableMixin(discord.mixins.EqualityComparable):
     Mixin that provides similar hashing and equality functionality as discord.py's `Hashable` mixin.
     Note: discord.py`s `Hashable` mixin bit-shifts `self.id` (`>> 22`); to prevent hash-collisions
     for the relative small `id` integers we generally use in tests, this bit-shift is omitted.
+    The hash is cached in `_hash` at construction time (written straight into `__dict__`, since
+    Mock's spec checking would reject a regular setattr of a non-spec attribute), which keeps
+    hashing off Mock's attribute machinery when these mocks end up in sets or dict keys.
     """
 
+    __slots__ = ()
+
     def __hash__(self):
-        return self.id
+        try:
+            return self._hash
+        except AttributeError:
+            return self.id
 
 
 class ColourMixin:
@@ -72,7 +108,6 @@ class CustomMockMixin:
     """
 
     child_mock_type = unittest.mock.MagicMock
-    discord_id = itertools.count(0)
 
     def __init__(self, spec_set: Any = None, **kwargs):
         name = kwargs.pop('name', None)  # `name` has special meaning for Mock classes, so we need to set it manually.
@@ -81,7 +116,7 @@ class CustomMockMixin:
         if name:
             self.name = name
         if spec_set:
-            self._extract_coroutine_methods_from_spec_instance(spec_set)
+            self._extract_coroutine_methods_from_spec_instance(type(spec_set))
 
     def _get_child_mock(self, **kw):
         """
@@ -102,22 +137,27 @@ class CustomMockMixin:
 
         return klass(**kw)
 
-    def _extract_coroutine_methods_from_spec_instance(self, source: Any) -> None:
+    def _extract_coroutine_methods_from_spec_instance(self, source: type) -> None:
         """Automatically detect coroutine functions in `source` and set them as AsyncMock attributes."""
-        for name, _method in inspect.getmembers(source, inspect.iscoroutinefunction):
+        for name in _coroutine_method_names(source):
             setattr(self, name, AsyncMock())
 
 
-# TODO: Remove me in Python 3.8
-class AsyncMock(CustomMockMixin, unittest.mock.MagicMock):
-    """
-    A MagicMock subclass to mock async callables.
-    Python 3.8 will introduce an AsyncMock class in the standard library that will have some more
-    features; this stand-in only overwrites the `__call__` method to an async version.
-    """
+try:
+    # Python 3.8 introduced an AsyncMock class in the standard library. It is both more featureful
+    # and cheaper to instantiate than our stand-in, which drags the whole CustomMockMixin
+    # machinery along for every leaf AsyncMock we attach.
+    from unittest.mock import AsyncMock
+except ImportError:
+    class AsyncMock(CustomMockMixin, unittest.mock.MagicMock):
+        """
+        A MagicMock subclass to mock async callables.
+        Python 3.8 introduced an AsyncMock class in the standard library that has some more
+        features; this stand-in only overwrites the `__call__` method to an async version.
+        """
 
-    async def __call__(self, *args, **kwargs):
-        return super().__call__(*args, **kwargs)
+        async def __call__(self, *args, **kwargs):
+            return super().__call__(*args, **kwargs)
 
 
 class AsyncIteratorMock:
@@ -131,7 +171,7 @@ class AsyncIteratorMock:
         if iterable is None:
             iterable = []
 
-        self.iter = iter(iterable)
+        self._items = collections.deque(iterable)
         self.iterable = iterable
 
         self.call_count = 0
@@ -140,10 +180,11 @@ class AsyncIteratorMock:
         return self
 
     async def __anext__(self):
-        try:
-            return next(self.iter)
-        except StopIteration:
+        # An emptiness check instead of try/except keeps exception handling off the hot path that
+        # runs once per awaited item.
+        if not self._items:
             raise StopAsyncIteration
+        return self._items.popleft()
 
     def __call__(self):
         """
@@ -161,8 +202,8 @@ class AsyncIteratorMock:
 
     @return_value.setter
     def return_value(self, iterable):
-        """Stores the `return_value` as `self.iterable` and its iterator as `self.iter`."""
-        self.iter = iter(iterable)
+        """Stores the `return_value` as `self.iterable` and its remaining items as `self._items`."""
+        self._items = collections.deque(iterable)
         self.iterable = iterable
 
     def assert_called(self):
@@ -189,27 +230,32 @@ class AsyncIteratorMock:
         self.call_count = 0
 
 
-# Create a guild instance to get a realistic Mock of `discord.Guild`
-guild_data = {
-    'id': 1,
-    'name': 'guild',
-    'region': 'Europe',
-    'verification_level': 2,
-    'default_notications': 1,
-    'afk_timeout': 100,
-    'icon': "icon.png",
-    'banner': 'banner.png',
-    'mfa_level': 1,
-    'splash': 'splash.png',
-    'system_channel_id': 464033278631084042,
-    'description': 'mocking is fun',
-    'max_presences': 10_000,
-    'max_members': 100_000,
-    'preferred_locale': 'UTC',
-    'owner_id': 1,
-    'afk_channel_id': 464033278631084042,
-}
-guild_instance = discord.Guild(data=guild_data, state=unittest.mock.MagicMock())
+# The spec instances below are only used for attribute introspection, so they are built lazily
+# and cached: constructing them at import time made every pytest worker pay for a full chain of
+# discord.py object constructions just to import `tests.helpers`.
+@functools.lru_cache(maxsize=None)
+def _guild_instance() -> discord.Guild:
+    """Create a guild instance to get a realistic Mock of `discord.Guild`."""
+    guild_data = {
+        'id': 1,
+        'name': 'guild',
+        'region': 'Europe',
+        'verification_level': 2,
+        'default_notications': 1,
+        'afk_timeout': 100,
+        'icon': "icon.png",
+        'banner': 'banner.png',
+        'mfa_level': 1,
+        'splash': 'splash.png',
+        'system_channel_id': 464033278631084042,
+        'description': 'mocking is fun',
+        'max_presences': 10_000,
+        'max_members': 100_000,
+        'preferred_locale': 'UTC',
+        'owner_id': 1,
+        'afk_channel_id': 464033278631084042,
+    }
+    return discord.Guild(data=guild_data, state=unittest.mock.MagicMock())
 
 
 class MockGuild(CustomMockMixin, unittest.mock.Mock, HashableMixin):
@@ -234,17 +280,20 @@ class MockGuild(CustomMockMixin, unittest.mock.Mock, HashableMixin):
     """
 
     def __init__(self, roles: Optional[Iterable[MockRole]] = None, **kwargs) -> None:
-        default_kwargs = {'id': next(self.discord_id), 'members': []}
-        super().__init__(spec_set=guild_instance, **collections.ChainMap(kwargs, default_kwargs))
+        default_kwargs = {'id': _next_discord_id(), 'members': []}
+        super().__init__(spec_set=_guild_instance(), **{**default_kwargs, **kwargs})
+        self.__dict__['_hash'] = self.id
 
-        self.roles = [MockRole(name="@everyone", position=1, id=0)]
+        self.roles = [_everyone_role()]
         if roles:
             self.roles.extend(roles)
 
 
-# Create a Role instance to get a realistic Mock of `discord.Role`
-role_data = {'name': 'role', 'id': 1}
-role_instance = discord.Role(guild=guild_instance, state=unittest.mock.MagicMock(), data=role_data)
+@functools.lru_cache(maxsize=None)
+def _role_instance() -> discord.Role:
+    """Create a Role instance to get a realistic Mock of `discord.Role`."""
+    role_data = {'name': 'role', 'id': 1}
+    return discord.Role(guild=_guild_instance(), state=unittest.mock.MagicMock(), data=role_data)
 
 
 class MockRole(CustomMockMixin, unittest.mock.Mock, ColourMixin, HashableMixin):
@@ -255,8 +304,9 @@ class MockRole(CustomMockMixin, unittest.mock.Mock, ColourMixin, HashableMixin):
     """
 
     def __init__(self, **kwargs) -> None:
-        default_kwargs = {'id': next(self.discord_id), 'name': 'role', 'position': 1}
-        super().__init__(spec_set=role_instance, **collections.ChainMap(kwargs, default_kwargs))
+        default_kwargs = {'id': _next_discord_id(), 'name': 'role', 'position': 1}
+        super().__init__(spec_set=_role_instance(), **{**default_kwargs, **kwargs})
+        self.__dict__['_hash'] = self.id
 
         if 'mention' not in kwargs:
             self.mention = f'&{self.name}'
@@ -266,10 +316,47 @@ class MockRole(CustomMockMixin, unittest.mock.Mock, ColourMixin, HashableMixin):
         return self.position < other.position
 
 
-# Create a Member instance to get a realistic Mock of `discord.Member`
-member_data = {'user': 'lemon', 'roles': [1]}
-state_mock = unittest.mock.MagicMock()
-member_instance = discord.Member(data=member_data, guild=guild_instance, state=state_mock)
+def _reset_clone_state(mock: CustomMockMixin, spec_type: type) -> None:
+    """
+    Give a cloned mock fresh mutable internals so it shares nothing with its template.
+    `copy.copy` of a Mock shallow-copies `__dict__`, which would leave the clone sharing the
+    template's child-mock registry, call records and spec-extracted AsyncMock attributes —
+    awaiting a method on one clone would mark it called on all of them. Resetting those and
+    re-attaching fresh AsyncMocks keeps call state isolated per instance.
+    """
+    mock.__dict__['_mock_children'] = {}
+    mock.__dict__['_mock_called'] = False
+    mock.__dict__['_mock_call_args'] = None
+    mock.__dict__['_mock_call_count'] = 0
+    mock.__dict__['_mock_call_args_list'] = unittest.mock._CallList()
+    mock.__dict__['_mock_mock_calls'] = unittest.mock._CallList()
+    mock.__dict__['method_calls'] = unittest.mock._CallList()
+    mock._extract_coroutine_methods_from_spec_instance(spec_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _everyone_role_template() -> MockRole:
+    """Build the `@everyone` role mock that every guild and member carries by default."""
+    return MockRole(name="@everyone", position=1, id=0)
+
+
+def _everyone_role() -> MockRole:
+    """
+    Return a fresh copy of the shared `@everyone` MockRole.
+    Every MockGuild and MockMember used to construct its own specced `@everyone` role, repeating
+    the full mock construction per instance. Copying the shared template is much cheaper, and
+    resetting the clone's mock state gives each instance its own children and call records.
+    """
+    role = copy.copy(_everyone_role_template())
+    _reset_clone_state(role, discord.Role)
+    return role
+
+
+@functools.lru_cache(maxsize=None)
+def _member_instance() -> discord.Member:
+    """Create a Member instance to get a realistic Mock of `discord.Member`."""
+    member_data = {'user': 'lemon', 'roles': [1]}
+    return discord.Member(data=member_data, guild=_guild_instance(), state=unittest.mock.MagicMock())
 
 
 class MockMember(CustomMockMixin, unittest.mock.Mock, ColourMixin, HashableMixin):
@@ -280,10 +367,11 @@ class MockMember(CustomMockMixin, unittest.mock.Mock, ColourMixin, HashableMixin
     """
 
     def __init__(self, roles: Optional[Iterable[MockRole]] = None, **kwargs) -> None:
-        default_kwargs = {'name': 'member', 'id': next(self.discord_id), 'bot': False}
-        super().__init__(spec_set=member_instance, **collections.ChainMap(kwargs, default_kwargs))
+        default_kwargs = {'name': 'member', 'id': _next_discord_id(), 'bot': False}
+        super().__init__(spec_set=_member_instance(), **{**default_kwargs, **kwargs})
+        self.__dict__['_hash'] = self.id
 
-        self.roles = [MockRole(name="@everyone", position=1, id=0)]
+        self.roles = [_everyone_role()]
         if roles:
             self.roles.extend(roles)
 
@@ -291,8 +379,13 @@ class MockMember(CustomMockMixin, unittest.mock.Mock, ColourMixin, HashableMixin
             self.mention = f"@{self.name}"
 
 
-# Create a User instance to get a realistic Mock of `discord.User`
-user_instance = discord.User(data=unittest.mock.MagicMock(), state=unittest.mock.MagicMock())
+@functools.lru_cache(maxsize=None)
+def _user_instance() -> discord.User:
+    """Create a User instance to get a realistic Mock of `discord.User`."""
+    return discord.User(data=unittest.mock.MagicMock(), state=unittest.mock.MagicMock())
+
+
+_user_template = None
 
 
 class MockUser(CustomMockMixin, unittest.mock.Mock, ColourMixin, HashableMixin):
@@ -300,201 +393,282 @@ class MockUser(CustomMockMixin, unittest.mock.Mock, ColourMixin, HashableMixin):
     A Mock subclass to mock User objects.
     Instances of this class will follow the specifications of `discord.User` instances. For more
     information, see the `MockGuild` docstring.
+    The first instantiation runs the full Mock construction, including the `dir()` sweep Mock
+    performs over the spec, with the default kwargs only, and snapshots that state as a template.
+    Caller kwargs are always applied on top through the clone path, so no call's arguments can
+    leak into the template; call records, child mocks and the spec-extracted AsyncMock attributes
+    are recreated per instance so no call state is shared either.
     """
 
     def __init__(self, **kwargs) -> None:
-        default_kwargs = {'name': 'user', 'id': next(self.discord_id), 'bot': False}
-        super().__init__(spec_set=user_instance, **collections.ChainMap(kwargs, default_kwargs))
-
+        global _user_template
+        if _user_template is None:
+            # Build the snapshot from the spec defaults only; the caller's kwargs are applied
+            # below, like on every other instantiation.
+            super().__init__(spec_set=_user_instance(), name='user', id=0, bot=False)
+            _user_template = dict(self.__dict__)
+        else:
+            self.__dict__.update(_user_template)
+
+        # Fresh mutable state, so instances never share children or call records.
+        _reset_clone_state(self, discord.User)
+
+        self.id = _next_discord_id()
+        name = kwargs.pop('name', 'user')
+        if name:
+            self.name = name
+        for key, value in kwargs.items():
+            setattr(self, key, value)
         if 'mention' not in kwargs:
             self.mention = f"@{self.name}"
+        self.__dict__['_hash'] = self.id
 
 
-# Create a Bot instance to get a realistic MagicMock of `discord.ext.commands.Bot`
-bot_instance = Bot(command_prefix=unittest.mock.MagicMock())
-bot_instance.http_session = None
-bot_instance.api_client = None
+@functools.lru_cache(maxsize=None)
+def _bot_instance() -> Bot:
+    """Create a Bot instance to get a realistic MagicMock of `discord.ext.commands.Bot`."""
+    bot_instance = Bot(command_prefix=unittest.mock.MagicMock())
+    bot_instance.http_session = None
+    bot_instance.api_client = None
+    return bot_instance
 
 
-class MockBot(CustomMockMixin, unittest.mock.MagicMock):
+class MockBot(CustomMockMixin, unittest.mock.Mock):
     """
-    A MagicMock subclass to mock Bot objects.
+    A Mock subclass to mock Bot objects.
     Instances of this class will follow the specifications of `discord.ext.commands.Bot` instances.
     For more information, see the `MockGuild` docstring.
     """
 
     def __init__(self, **kwargs) -> None:
-        super().__init__(spec_set=bot_instance, **kwargs)
+        super().__init__(spec_set=_bot_instance(), **kwargs)
 
         # self.wait_for is *not* a coroutine function, but returns a coroutine nonetheless and
         # and should therefore be awaited. (The documentation calls it a coroutine as well, which
         # is technically incorrect, since it's a regular def.)
         self.wait_for = AsyncMock()
 
-        # Since calling `create_task` on our MockBot does not actually schedule the coroutine object
-        # as a task in the asyncio loop, this `side_effect` calls `close()` on the coroutine object
-        # to prevent "has not been awaited"-warnings.
-        self.loop.create_task.side_effect = lambda coroutine: coroutine.close()
+    def _get_child_mock(self, **kw):
+        """
+        Configure the `loop` child mock the moment it is first accessed.
+        Since calling `create_task` on our MockBot does not actually schedule the coroutine object
+        as a task in the asyncio loop, the `side_effect` calls `close()` on the coroutine object
+        to prevent "has not been awaited"-warnings. Setting it here instead of in `__init__` means
+        MockBots whose tests never touch the loop do not pay for the two extra child mocks.
+        """
+        child = super()._get_child_mock(**kw)
+
+        if kw.get("name") == "loop":
+            child.create_task.side_effect = lambda coroutine: coroutine.close()
+
+        return child
 
 
-# Create a TextChannel instance to get a realistic MagicMock of `discord.TextChannel`
-channel_data = {
-    'id': 1,
-    'type': 'TextChannel',
-    'name': 'channel',
-    'parent_id': 1234567890,
-    'topic': 'topic',
-    'position': 1,
-    'nsfw': False,
-    'last_message_id': 1,
-}
-state = unittest.mock.MagicMock()
-guild = unittest.mock.MagicMock()
-channel_instance = discord.TextChannel(state=state, guild=guild, data=channel_data)
+@functools.lru_cache(maxsize=None)
+def _channel_instance() -> discord.TextChannel:
+    """Create a TextChannel instance to get a realistic MagicMock of `discord.TextChannel`."""
+    channel_data = {
+        'id': 1,
+        'type': 'TextChannel',
+        'name': 'channel',
+        'parent_id': 1234567890,
+        'topic': 'topic',
+        'position': 1,
+        'nsfw': False,
+        'last_message_id': 1,
+    }
+    return discord.TextChannel(
+        state=unittest.mock.MagicMock(), guild=unittest.mock.MagicMock(), data=channel_data
+    )
 
 
 class MockTextChannel(CustomMockMixin, unittest.mock.Mock, HashableMixin):
     """
-    A MagicMock subclass to mock TextChannel objects.
+    A Mock subclass to mock TextChannel objects.
     Instances of this class will follow the specifications of `discord.TextChannel` instances. For
     more information, see the `MockGuild` docstring.
     """
 
     def __init__(self, name: str = 'channel', channel_id: int = 1, **kwargs) -> None:
-        default_kwargs = {'id': next(self.discord_id), 'name': 'channel', 'guild': MockGuild()}
-        super().__init__(spec_set=channel_instance, **collections.ChainMap(kwargs, default_kwargs))
+        default_kwargs = {'id': _next_discord_id(), 'name': 'channel'}
+        super().__init__(spec_set=_channel_instance(), **{**default_kwargs, **kwargs})
+        self.__dict__['_hash'] = self.id
 
         if 'mention' not in kwargs:
             self.mention = f"#{self.name}"
 
-
-# Create a Message instance to get a realistic MagicMock of `discord.Message`
-message_data = {
-    'id': 1,
-    'webhook_id': 431341013479718912,
-    'attachments': [],
-    'embeds': [],
-    'application': 'Python Discord',
-    'activity': 'mocking',
-    'channel': unittest.mock.MagicMock(),
-    'edited_timestamp': '2019-10-14T15:33:48+00:00',
-    'type': 'message',
-    'pinned': False,
-    'mention_everyone': False,
-    'tts': None,
-    'content': 'content',
-    'nonce': None,
-}
-state = unittest.mock.MagicMock()
-channel = unittest.mock.MagicMock()
-message_instance = discord.Message(state=state, channel=channel, data=message_data)
-
-# Create a Context instance to get a realistic MagicMock of `discord.ext.commands.Context`
-context_instance = Context(message=unittest.mock.MagicMock(), prefix=unittest.mock.MagicMock())
-
-
-class MockContext(CustomMockMixin, unittest.mock.MagicMock):
-    """
-    A MagicMock subclass to mock Context objects.
+    def __getattr__(self, name):
+        """Build the default MockGuild only when a test actually touches `guild`."""
+        if name == 'guild':
+            self.guild = MockGuild()
+            return self.guild
+
+        return super().__getattr__(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _message_instance() -> discord.Message:
+    """Create a Message instance to get a realistic MagicMock of `discord.Message`."""
+    message_data = {
+        'id': 1,
+        'webhook_id': 431341013479718912,
+        'attachments': [],
+        'embeds': [],
+        'application': 'Python Discord',
+        'activity': 'mocking',
+        'channel': unittest.mock.MagicMock(),
+        'edited_timestamp': '2019-10-14T15:33:48+00:00',
+        'type': 'message',
+        'pinned': False,
+        'mention_everyone': False,
+        'tts': None,
+        'content': 'content',
+        'nonce': None,
+    }
+    return discord.Message(
+        state=unittest.mock.MagicMock(), channel=unittest.mock.MagicMock(), data=message_data
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _context_instance() -> Context:
+    """Create a Context instance to get a realistic MagicMock of `discord.ext.commands.Context`."""
+    return Context(message=unittest.mock.MagicMock(), prefix=unittest.mock.MagicMock())
+
+
+class MockContext(CustomMockMixin, unittest.mock.Mock):
+    """
+    A Mock subclass to mock Context objects.
     Instances of this class will follow the specifications of `discord.ext.commands.Context`
     instances. For more information, see the `MockGuild` docstring.
     """
 
+    # Default children are only built when a test first touches them; most tests only call
+    # `ctx.send` and never look at the bot, guild, author or channel.
+    _lazy_child_types = {'bot': MockBot, 'guild': MockGuild, 'author': MockMember, 'channel': MockTextChannel}
+
     def __init__(self, **kwargs) -> None:
-        super().__init__(spec_set=context_instance, **kwargs)
-        self.bot = kwargs.get('bot', MockBot())
-        self.guild = kwargs.get('guild', MockGuild())
-        self.author = kwargs.get('author', MockMember())
-        self.channel = kwargs.get('channel', MockTextChannel())
+        super().__init__(spec_set=_context_instance(), **kwargs)
+
+    def __getattr__(self, name):
+        """Create the default child mock for `bot`/`guild`/`author`/`channel` on first access."""
+        child_type = self._lazy_child_types.get(name)
+        if child_type is not None:
+            setattr(self, name, child_type())
+            return self.__dict__[name]
+
+        return super().__getattr__(name)
 
 
-attachment_instance = discord.Attachment(data=unittest.mock.MagicMock(id=1), state=unittest.mock.MagicMock())
+@functools.lru_cache(maxsize=None)
+def _attachment_instance() -> discord.Attachment:
+    """Create an Attachment instance to get a realistic MagicMock of `discord.Attachment`."""
+    return discord.Attachment(data=unittest.mock.MagicMock(id=1), state=unittest.mock.MagicMock())
 
 
-class MockAttachment(CustomMockMixin, unittest.mock.MagicMock):
+class MockAttachment(CustomMockMixin, unittest.mock.Mock):
     """
-    A MagicMock subclass to mock Attachment objects.
+    A Mock subclass to mock Attachment objects.
     Instances of this class will follow the specifications of `discord.Attachment` instances. For
     more information, see the `MockGuild` docstring.
     """
 
     def __init__(self, **kwargs) -> None:
-        super().__init__(spec_set=attachment_instance, **kwargs)
+        super().__init__(spec_set=_attachment_instance(), **kwargs)
 
 
-class MockMessage(CustomMockMixin, unittest.mock.MagicMock):
+class MockMessage(CustomMockMixin, unittest.mock.Mock):
     """
-    A MagicMock subclass to mock Message objects.
+    A Mock subclass to mock Message objects.
     Instances of this class will follow the specifications of `discord.Message` instances. For more
     information, see the `MockGuild` docstring.
     """
 
     def __init__(self, **kwargs) -> None:
         default_kwargs = {'attachments': []}
-        super().__init__(spec_set=message_instance, **collections.ChainMap(kwargs, default_kwargs))
+        super().__init__(spec_set=_message_instance(), **{**default_kwargs, **kwargs})
         self.author = kwargs.get('author', MockMember())
         self.channel = kwargs.get('channel', MockTextChannel())
 
 
-emoji_data = {'require_colons': True, 'managed': True, 'id': 1, 'name': 'hyperlemon'}
-emoji_instance = discord.Emoji(guild=MockGuild(), state=unittest.mock.MagicMock(), data=emoji_data)
+@functools.lru_cache(maxsize=None)
+def _emoji_instance() -> discord.Emoji:
+    """Create an Emoji instance to get a realistic MagicMock of `discord.Emoji`."""
+    emoji_data = {'require_colons': True, 'managed': True, 'id': 1, 'name': 'hyperlemon'}
+    # A plain spec mock suffices here; constructing a full MockGuild would attach deep MagicMock
+    # children to the spec instance for no benefit.
+    guild = unittest.mock.Mock(spec=discord.Guild)
+    return discord.Emoji(guild=guild, state=unittest.mock.MagicMock(), data=emoji_data)
 
 
-class MockEmoji(CustomMockMixin, unittest.mock.MagicMock):
+class MockEmoji(CustomMockMixin, unittest.mock.Mock):
     """
-    A MagicMock subclass to mock Emoji objects.
+    A Mock subclass to mock Emoji objects.
     Instances of this class will follow the specifications of `discord.Emoji` instances. For more
     information, see the `MockGuild` docstring.
     """
 
     def __init__(self, **kwargs) -> None:
-        super().__init__(spec_set=emoji_instance, **kwargs)
+        super().__init__(spec_set=_emoji_instance(), **kwargs)
         self.guild = kwargs.get('guild', MockGuild())
 
 
-partial_emoji_instance = discord.PartialEmoji(animated=False, name='guido')
+@functools.lru_cache(maxsize=None)
+def _partial_emoji_instance() -> discord.PartialEmoji:
+    """Create a PartialEmoji instance to get a realistic MagicMock of `discord.PartialEmoji`."""
+    return discord.PartialEmoji(animated=False, name='guido')
 
 
-class MockPartialEmoji(CustomMockMixin, unittest.mock.MagicMock):
+class MockPartialEmoji(CustomMockMixin, unittest.mock.Mock):
     """
-    A MagicMock subclass to mock PartialEmoji objects.
+    A Mock subclass to mock PartialEmoji objects.
     Instances of this class will follow the specifications of `discord.PartialEmoji` instances. For
     more information, see the `MockGuild` docstring.
     """
 
     def __init__(self, **kwargs) -> None:
-        super().__init__(spec_set=partial_emoji_instance, **kwargs)
+        super().__init__(spec_set=_partial_emoji_instance(), **kwargs)
 
 
-reaction_instance = discord.Reaction(message=MockMessage(), data={'me': True}, emoji=MockEmoji())
+@functools.lru_cache(maxsize=None)
+def _reaction_instance() -> discord.Reaction:
+    """Create a Reaction instance to get a realistic MagicMock of `discord.Reaction`."""
+    # Plain spec mocks instead of MockMessage/MockEmoji for the same reason as in
+    # `_emoji_instance`: the spec instance only needs the right attribute surface.
+    message = unittest.mock.Mock(spec=discord.Message)
+    emoji = unittest.mock.Mock(spec=discord.Emoji)
+    return discord.Reaction(message=message, data={'me': True}, emoji=emoji)
 
 
-class MockReaction(CustomMockMixin, unittest.mock.MagicMock):
+class MockReaction(CustomMockMixin, unittest.mock.Mock):
     """
-    A MagicMock subclass to mock Reaction objects.
+    A Mock subclass to mock Reaction objects.
     Instances of this class will follow the specifications of `discord.Reaction` instances. For
     more information, see the `MockGuild` docstring.
     """
 
     def __init__(self, **kwargs) -> None:
-        super().__init__(spec_set=reaction_instance, **kwargs)
+        super().__init__(spec_set=_reaction_instance(), **kwargs)
         self.emoji = kwargs.get('emoji', MockEmoji())
         self.message = kwargs.get('message', MockMessage())
         self.users = AsyncIteratorMock(kwargs.get('users', []))
 
 
-webhook_instance = discord.Webhook(data=unittest.mock.MagicMock(), adapter=unittest.mock.MagicMock())
+@functools.lru_cache(maxsize=None)
+def _webhook_instance() -> discord.Webhook:
+    """Create a Webhook instance to get a realistic MagicMock of `discord.Webhook`."""
+    return discord.Webhook(data=unittest.mock.MagicMock(), adapter=unittest.mock.MagicMock())
 
 
-class MockAsyncWebhook(CustomMockMixin, unittest.mock.MagicMock):
+class MockAsyncWebhook(CustomMockMixin, unittest.mock.Mock):
     """
-    A MagicMock subclass to mock Webhook objects using an AsyncWebhookAdapter.
+    A Mock subclass to mock Webhook objects using an AsyncWebhookAdapter.
     Instances of this class will follow the specifications of `discord.Webhook` instances. For
     more information, see the `MockGuild` docstring.
     """
 
     def __init__(self, **kwargs) -> None:
-        super().__init__(spec_set=webhook_instance, **kwargs)
+        super().__init__(spec_set=_webhook_instance(), **kwargs)
 
         # Because Webhooks can also use a synchronous "WebhookAdapter", the methods are not defined
         # as coroutines. That's why we need to set the methods manually.
@@ -11,7 +11,6 @@
 # if __name__ == '__main__':
 #     unittest.main()
 #
-import asyncio
 import unittest
 
 
@@ -19,27 +18,29 @@ from cogs import helloworld
 from tests.helpers import MockBot, MockContext
 
 
-class BotCogTests(unittest.TestCase):
-    def test_command_with_python_as_input(self):
-        """Test if the `!hello python` command correctly print hello world in python."""
-        mocked_bot = MockBot()
-        bot_cog = helloworld.HelloWorld(mocked_bot)
-        mocked_context = MockContext()
+class BotCogTests(unittest.IsolatedAsyncioTestCase):
+    # The cog is stateless, so the bot and cog are built once for the whole test case; only the
+    # context needs to be fresh per test since we assert on its `send` calls.
+    ALL_LANGS = "arm\nbash\nc\ncobol\ncpp\ncsharp\nerlang\ngo\nhaskell\njava\njavascript\njulia\nlisp\nlua\nobjectivec\npascal\nperl\nphp\npython\nruby\nrust\nscala\nswift\n"
 
-        text = "```python\nprint(\"Hello, World!\")\n```\n"
-        asyncio.run(bot_cog.hello.callback(bot_cog, mocked_context, lang="Python"))
-        mocked_context.send.assert_called_with(text)
+    @classmethod
+    def setUpClass(cls):
+        cls.mocked_bot = MockBot()
+        cls.bot_cog = helloworld.HelloWorld(cls.mocked_bot)
 
-    def test_langs_command_listing_all_available_languages(self):
-        """Test if the !hellolangs prints all the available languages"""
-        mocked_bot = MockBot()
-        bot_cog = helloworld.HelloWorld(mocked_bot)
-        mocked_context = MockContext()
+    def setUp(self):
+        self.mocked_context = MockContext()
 
-        text = "arm\nbash\nc\ncobol\ncpp\ncsharp\nerlang\ngo\nhaskell\njava\njavascript\njulia\nlisp\nlua\nobjectivec\npascal\nperl\nphp\npython\nruby\nrust\nscala\nswift\n"
+    async def test_command_with_python_as_input(self):
+        """Test if the `!hello python` command correctly print hello world in python."""
+        text = "```python\nprint(\"Hello, World!\")\n```\n"
+        await self.bot_cog.hello.callback(self.bot_cog, self.mocked_context, lang="Python")
+        self.mocked_context.send.assert_called_with(text)
 
-        asyncio.run(bot_cog.hellolangs.callback(bot_cog, mocked_context))
-        mocked_context.send.assert_called_with(text)
+    async def test_langs_command_listing_all_available_languages(self):
+        """Test if the !hellolangs prints all the available languages"""
+        await self.bot_cog.hellolangs.callback(self.bot_cog, self.mocked_context)
+        self.mocked_context.send.assert_called_with(self.ALL_LANGS)
 
 if __name__=="__main__":
     unittest.main()
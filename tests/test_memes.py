@@ -1,40 +1,27 @@
-import asyncio
 import unittest
 
 
 from cogs import memes
 from tests.helpers import MockBot, MockContext
 
-class MyTestCase(unittest.TestCase):
-    def test_blue_command(self):
-        """Test if the `!hello python` command correctly print hello world in python."""
-        mocked_bot = MockBot()
-        bot_cog = memes.Memes(mocked_bot)
-        mocked_context = MockContext()
-
-        text = "ORANGE!"
-        asyncio.run(bot_cog.blue.callback(bot_cog, mocked_context))
-        mocked_context.send.assert_called_with(text)
-
-    def test_orange_command(self):
-        """Test if the `!hello python` command correctly print hello world in python."""
-        mocked_bot = MockBot()
-        bot_cog = memes.Memes(mocked_bot)
-        mocked_context = MockContext()
-
-        text = "BLUE!"
-        asyncio.run(bot_cog.orange.callback(bot_cog, mocked_context))
-        mocked_context.send.assert_called_with(text)
-
-    def test_command_with_user_input(self):
-        """Test if the `!hello python` command correctly print hello world in python."""
-        mocked_bot = MockBot()
-        bot_cog = memes.Memes(mocked_bot)
-        mocked_context = MockContext()
-
-        text = "funguje"
-        asyncio.run(bot_cog.say.callback(bot_cog, mocked_context, phrase="funguje"))
-        mocked_context.send.assert_called_with(text)
+class MyTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.bot_cog = memes.Memes(MockBot())
+        self.mocked_context = MockContext()
+
+    async def test_simple_chat_commands(self):
+        """Test the !blue/!orange chants and !say echoing the user's phrase."""
+        test_cases = (
+            ('blue', 'ORANGE!', {}),
+            ('orange', 'BLUE!', {}),
+            ('say', 'funguje', {'phrase': 'funguje'}),
+        )
+
+        for command, expected, kwargs in test_cases:
+            with self.subTest(command=command, expected=expected):
+                await getattr(self.bot_cog, command).callback(self.bot_cog, self.mocked_context, **kwargs)
+                self.mocked_context.send.assert_called_once_with(expected)
+                self.mocked_context.send.reset_mock()
 
 
     # def test_command_drink(self):